@@ -6,10 +6,8 @@ Real-world use case: Author gender prediction
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import re
-from collections import Counter
+
+from gender_scoring import classify_gender, batch_row
 
 st.set_page_config(
     page_title="Gender Classification",
@@ -38,94 +36,6 @@ st.sidebar.markdown("""
 """)
 st.sidebar.caption("⚠️ Note: Based on linguistic patterns, not identity")
 
-# Gender-associated language patterns (based on sociolinguistic research)
-GENDER_MARKERS = {
-    'male': ['sports', 'car', 'game', 'gaming', 'tech', 'computer', 'beer', 'football', 'dude', 'bro', 'man', 'guys'],
-    'female': ['love', 'feel', 'shopping', 'cute', 'adorable', 'gorgeous', 'beautiful', 'wonderful', 'excited', 'amazing', 'perfect']
-}
-
-def classify_gender(text):
-    """Classify author gender based on writing style"""
-    text_lower = text.lower()
-    words = text_lower.split()
-    word_count = len(words)
-    
-    # Initialize scores
-    male_score = 0
-    female_score = 0
-    found_male = []
-    found_female = []
-    
-    # Check for gender markers
-    for marker in GENDER_MARKERS['male']:
-        if marker in text_lower:
-            count = text_lower.count(marker)
-            male_score += count * 0.3
-            found_male.extend([marker] * count)
-    
-    for marker in GENDER_MARKERS['female']:
-        if marker in text_lower:
-            count = text_lower.count(marker)
-            female_score += count * 0.3
-            found_female.extend([marker] * count)
-    
-    # Emotional language (more common in female writing)
-    emotion_words = ['feel', 'felt', 'emotion', 'heart', 'happy', 'sad', 'excited', 'worried']
-    emotion_count = sum(1 for word in emotion_words if word in text_lower)
-    female_score += emotion_count * 0.2
-    
-    # Assertive language (more common in male writing)
-    assertive_words = ['definitely', 'obviously', 'clearly', 'actually', 'fact']
-    assertive_count = sum(1 for word in assertive_words if word in text_lower)
-    male_score += assertive_count * 0.2
-    
-    # Hedging language (more common in female writing)
-    hedges = ['maybe', 'perhaps', 'might', 'possibly', 'i think', 'i feel', 'sort of', 'kind of']
-    hedge_count = sum(1 for hedge in hedges if hedge in text_lower)
-    female_score += hedge_count * 0.25
-    
-    # Intensifiers
-    intensifiers = ['so', 'very', 'really', 'quite', 'extremely']
-    intensifier_count = sum(text_lower.count(word) for word in intensifiers)
-    female_score += intensifier_count * 0.1
-    
-    # Question marks (more common in female writing)
-    question_count = text.count('?')
-    female_score += question_count * 0.15
-    
-    # Exclamation marks
-    exclamation_count = text.count('!')
-    if exclamation_count > 0:
-        female_score += exclamation_count * 0.1
-    
-    # Determine classification
-    total_score = male_score + female_score
-    
-    if total_score == 0 or abs(male_score - female_score) < 0.3:
-        predicted_gender = 'neutral'
-        gender_display = '⚧️ Neutral/Uncertain'
-        confidence = 0.5
-    elif male_score > female_score:
-        predicted_gender = 'male'
-        gender_display = '🚹 Male'
-        confidence = male_score / total_score if total_score > 0 else 0.5
-    else:
-        predicted_gender = 'female'
-        gender_display = '🚺 Female'
-        confidence = female_score / total_score if total_score > 0 else 0.5
-    
-    return {
-        'text': text,
-        'predicted_gender': predicted_gender,
-        'gender_display': gender_display,
-        'confidence': confidence,
-        'male_score': male_score,
-        'female_score': female_score,
-        'found_male_markers': found_male,
-        'found_female_markers': found_female,
-        'word_count': word_count
-    }
-
 # Mode: Single Input
 if mode == "Single Input":
     st.header("📝 Single Text Processing")
@@ -157,6 +67,7 @@ if mode == "Single Input":
                 'Category': ['Male', 'Female'],
                 'Score': [result['male_score'], result['female_score']]
             })
+            import plotly.express as px
             fig = px.bar(scores_df, x='Category', y='Score',
                         title='Gender Score Comparison',
                         color='Score', color_continuous_scale='Viridis')
@@ -166,10 +77,10 @@ if mode == "Single Input":
             col1, col2 = st.columns(2)
             with col1:
                 if result['found_male_markers']:
-                    st.write("**Male Markers:**", ', '.join(set(result['found_male_markers'])))
+                    st.write("**Male Markers:**", ', '.join(result['found_male_markers']))
             with col2:
                 if result['found_female_markers']:
-                    st.write("**Female Markers:**", ', '.join(set(result['found_female_markers'])))
+                    st.write("**Female Markers:**", ', '.join(result['found_female_markers']))
         else:
             st.warning("Please enter some text.")
 
@@ -185,35 +96,36 @@ elif mode == "Batch Processing":
         
         if 'text' in df.columns:
             if st.button("🔍 Classify All", type="primary"):
-                results = []
                 progress_bar = st.progress(0)
                 
-                for idx, text in enumerate(df['text']):
-                    result = classify_gender(str(text))
-                    results.append({
-                        'text': result['text'][:60] + '...',
-                        'gender': result['gender_display'],
-                        'confidence': result['confidence']
-                    })
-                    progress_bar.progress((idx + 1) / len(df))
+                # Lowercase the whole column once, as a plain list the scanner
+                # can consume without per-row coercion
+                text_col = df['text'].astype(str)
+                lowers = text_col.str.lower().tolist()
+                scored = []
+                # Each progress update is a round-trip to the browser; send ~100
+                step = max(1, len(df) // 100)
+                for idx, text_lower in enumerate(lowers):
+                    scored.append(batch_row(text_lower))
+                    if idx % step == 0 or idx == len(df) - 1:
+                        progress_bar.progress((idx + 1) / len(df))
                 
-                results_df = pd.DataFrame(results)
+                results_df = pd.DataFrame(scored, columns=['predicted_gender', 'gender', 'confidence'])
+                results_df.insert(0, 'text', (text_col.str.slice(0, 60) + '...').to_numpy())
                 st.success(f"✅ Classified {len(results_df)} texts!")
                 
+                gender_totals = results_df['predicted_gender'].value_counts()
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total", len(results_df))
                 with col2:
-                    male = len(results_df[results_df['gender'].str.contains('Male') & ~results_df['gender'].str.contains('Female')])
-                    st.metric("Male", male)
+                    st.metric("Male", int(gender_totals.get('male', 0)))
                 with col3:
-                    female = len(results_df[results_df['gender'].str.contains('Female')])
-                    st.metric("Female", female)
+                    st.metric("Female", int(gender_totals.get('female', 0)))
                 
-                gender_counts = results_df['gender'].value_counts()
-                fig = px.pie(values=gender_counts.values, names=gender_counts.index,
-                            title='Gender Distribution')
-                st.plotly_chart(fig, use_container_width=True)
+                # Counts are already aggregated; a native chart avoids shipping a Plotly figure
+                st.subheader("📊 Gender Distribution")
+                st.bar_chart(gender_totals)
                 
                 st.dataframe(results_df, use_container_width=True)
                 csv = results_df.to_csv(index=False)
@@ -250,6 +162,7 @@ else:
         for idx, row in results_df.iterrows():
             st.info(f"{row['gender']} ({row['confidence']:.1%}): {row['text']}")
         
+        import plotly.express as px
         fig = px.bar(results_df, x=results_df.index, y='confidence',
                      title='Confidence Scores',
                      color='confidence', color_continuous_scale='Viridis')
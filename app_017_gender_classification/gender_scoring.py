@@ -0,0 +1,150 @@
+"""
+Gender scoring for NLP App 017
+Kept apart from the Streamlit UI in app.py
+"""
+
+from collections import Counter
+
+# Gender-associated language patterns (based on sociolinguistic research)
+GENDER_MARKERS = {
+    'male': ['sports', 'car', 'game', 'gaming', 'tech', 'computer', 'beer', 'football', 'dude', 'bro', 'man', 'guys'],
+    'female': ['love', 'feel', 'shopping', 'cute', 'adorable', 'gorgeous', 'beautiful', 'wonderful', 'excited', 'amazing', 'perfect']
+}
+
+# Writing-style cues: (words, score bucket, weight per hit, count every occurrence)
+STYLE_CUES = [
+    # Emotional language (more common in female writing)
+    (['feel', 'felt', 'emotion', 'heart', 'happy', 'sad', 'excited', 'worried'], 'female', 0.2, False),
+    # Assertive language (more common in male writing)
+    (['definitely', 'obviously', 'clearly', 'actually', 'fact'], 'male', 0.2, False),
+    # Hedging language (more common in female writing)
+    (['maybe', 'perhaps', 'might', 'possibly', 'i think', 'i feel', 'sort of', 'kind of'], 'female', 0.25, False),
+    # Intensifiers
+    (['so', 'very', 'really', 'quite', 'extremely'], 'female', 0.1, True),
+    # Question marks (more common in female writing)
+    (['?'], 'female', 0.15, True),
+    # Exclamation marks
+    (['!'], 'female', 0.1, True),
+]
+MARKER_WEIGHT = 0.3
+
+def build_marker_table():
+    """Flatten markers and cues into score slots and a word -> slots lookup
+    
+    Each slot is one gender marker or one cue category: (gender, weight,
+    marker to report or None). Slots are numbered in the order the scores
+    are summed, so scoring from the table adds floats in the same order.
+    """
+    slots = []
+    table = {}
+    for gender, markers in GENDER_MARKERS.items():
+        for marker in markers:
+            table.setdefault(marker, []).append((len(slots), True))
+            slots.append((gender, MARKER_WEIGHT, marker))
+    for cue_words, gender, weight, counted in STYLE_CUES:
+        for word in cue_words:
+            table.setdefault(word, []).append((len(slots), counted))
+        slots.append((gender, weight, None))
+    return slots, {word: tuple(entries) for word, entries in table.items()}
+
+SCORE_SLOTS, MARKER_TABLE = build_marker_table()
+
+# Every distinct marker and cue, so each one is scanned for once per text
+ALL_MARKERS = tuple(MARKER_TABLE)
+
+# Built once per process, when this module is first imported
+def build_marker_automaton(markers):
+    """Build an Aho-Corasick automaton over markers (None without pyahocorasick)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for marker in markers:
+        automaton.add_word(marker, (marker, len(marker)))
+    automaton.make_automaton()
+    return automaton
+
+MARKER_AUTOMATON = build_marker_automaton(ALL_MARKERS)
+
+def find_markers(text_lower):
+    """Count the occurrences of every known marker present in lowercased text"""
+    present = {}
+    if MARKER_AUTOMATON is not None:
+        # Single pass over the text; overlapping repeats of the same marker
+        # are skipped so counts match str.count()
+        next_start = {}
+        for end, (marker, length) in MARKER_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if start >= next_start.get(marker, 0):
+                present[marker] = present.get(marker, 0) + 1
+                next_start[marker] = end + 1
+        return present
+    for marker in ALL_MARKERS:
+        count = text_lower.count(marker)
+        if count:
+            present[marker] = count
+    return present
+
+def _score_lower(text_lower):
+    """Score text that has already been lowercased"""
+    words = text_lower.split()
+    word_count = len(words)
+    
+    scores = {'male': 0.0, 'female': 0.0}
+    found = {'male': Counter(), 'female': Counter()}
+    
+    # Find every marker once, then fold the hits into their score slots
+    slot_hits = {}
+    for marker, count in find_markers(text_lower).items():
+        for slot, counted in MARKER_TABLE[marker]:
+            slot_hits[slot] = slot_hits.get(slot, 0) + (count if counted else 1)
+    
+    # Add slots in table order so the float sums near the 0.3 decision
+    # margin match the per-list loops exactly
+    for slot in sorted(slot_hits):
+        gender, weight, marker = SCORE_SLOTS[slot]
+        scores[gender] += slot_hits[slot] * weight
+        if marker:
+            found[gender][marker] = slot_hits[slot]
+    
+    male_score = scores['male']
+    female_score = scores['female']
+    found_male = found['male']
+    found_female = found['female']
+    
+    # Determine classification
+    total_score = male_score + female_score
+    
+    if total_score == 0 or abs(male_score - female_score) < 0.3:
+        predicted_gender = 'neutral'
+        gender_display = '⚧️ Neutral/Uncertain'
+        confidence = 0.5
+    elif male_score > female_score:
+        predicted_gender = 'male'
+        gender_display = '🚹 Male'
+        confidence = male_score / total_score if total_score > 0 else 0.5
+    else:
+        predicted_gender = 'female'
+        gender_display = '🚺 Female'
+        confidence = female_score / total_score if total_score > 0 else 0.5
+    
+    return {
+        'predicted_gender': predicted_gender,
+        'gender_display': gender_display,
+        'confidence': confidence,
+        'male_score': male_score,
+        'female_score': female_score,
+        'found_male_markers': found_male,
+        'found_female_markers': found_female,
+        'word_count': word_count
+    }
+
+def classify_gender(text):
+    """Classify author gender based on writing style"""
+    return {'text': text, **_score_lower(text.lower())}
+
+def batch_row(text_lower):
+    """Reduce a score to the columns shown in the batch table"""
+    result = _score_lower(text_lower)
+    return result['predicted_gender'], result['gender_display'], result['confidence']
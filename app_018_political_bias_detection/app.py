@@ -6,10 +6,8 @@ Real-world use case: News article bias analysis
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import re
-from collections import Counter
+
+from bias_scoring import detect_political_bias, batch_row
 
 st.set_page_config(
     page_title="Political Bias Detection",
@@ -37,91 +35,6 @@ st.sidebar.markdown("""
 - 🔴 Right/Conservative
 """)
 
-# Political bias keywords (simplified for demonstration)
-BIAS_KEYWORDS = {
-    'left': ['progressive', 'liberal', 'social justice', 'equality', 'diversity', 'climate change', 'universal healthcare', 'reform', 'regulation', 'workers rights'],
-    'right': ['conservative', 'traditional', 'freedom', 'liberty', 'free market', 'deregulation', 'law and order', 'strong borders', 'family values', 'fiscal responsibility'],
-    'neutral': ['according to', 'reported', 'stated', 'analysis shows', 'data indicates', 'research suggests', 'officials say', 'experts note']
-}
-
-def detect_political_bias(text):
-    """Detect political bias in text"""
-    text_lower = text.lower()
-    words = text_lower.split()
-    word_count = len(words)
-    
-    # Score each bias category
-    left_score = 0
-    right_score = 0
-    neutral_score = 0
-    found_left = []
-    found_right = []
-    found_neutral = []
-    
-    # Check for bias keywords
-    for keyword in BIAS_KEYWORDS['left']:
-        if keyword in text_lower:
-            count = text_lower.count(keyword)
-            left_score += count * 0.4
-            found_left.extend([keyword] * count)
-    
-    for keyword in BIAS_KEYWORDS['right']:
-        if keyword in text_lower:
-            count = text_lower.count(keyword)
-            right_score += count * 0.4
-            found_right.extend([keyword] * count)
-    
-    for phrase in BIAS_KEYWORDS['neutral']:
-        if phrase in text_lower:
-            count = text_lower.count(phrase)
-            neutral_score += count * 0.3
-            found_neutral.extend([phrase] * count)
-    
-    # Emotional vs factual language
-    emotional_words = ['outrageous', 'shocking', 'terrible', 'wonderful', 'amazing', 'horrific']
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
-    if emotional_count > 2:
-        # Emotional language reduces neutrality
-        neutral_score -= 0.3
-    
-    # Determine bias
-    total_score = left_score + right_score + neutral_score
-    
-    if total_score == 0 or neutral_score > (left_score + right_score):
-        bias = 'center'
-        bias_display = '⚪ Center/Neutral'
-        lean_score = 0
-    elif left_score > right_score:
-        bias = 'left'
-        bias_display = '🔵 Left/Liberal'
-        lean_score = (left_score / max(total_score, 0.1)) * 100
-    else:
-        bias = 'right'
-        bias_display = '🔴 Right/Conservative'
-        lean_score = (right_score / max(total_score, 0.1)) * 100
-    
-    # Confidence
-    if total_score == 0:
-        confidence = 0.5
-    else:
-        max_score = max(left_score, right_score, neutral_score)
-        confidence = max_score / total_score
-    
-    return {
-        'text': text,
-        'bias': bias,
-        'bias_display': bias_display,
-        'lean_score': lean_score,
-        'confidence': confidence,
-        'left_score': left_score,
-        'right_score': right_score,
-        'neutral_score': neutral_score,
-        'found_left': found_left,
-        'found_right': found_right,
-        'found_neutral': found_neutral,
-        'word_count': word_count
-    }
-
 # Mode: Single Input
 if mode == "Single Input":
     st.header("📝 Single Text Processing")
@@ -153,6 +66,7 @@ if mode == "Single Input":
                 'Category': ['Left', 'Center', 'Right'],
                 'Score': [result['left_score'], result['neutral_score'], result['right_score']]
             })
+            import plotly.express as px
             fig = px.bar(scores_df, x='Category', y='Score',
                         title='Political Bias Scores',
                         color='Category',
@@ -164,13 +78,13 @@ if mode == "Single Input":
             col1, col2, col3 = st.columns(3)
             with col1:
                 if result['found_left']:
-                    st.write("**Left:** " + ', '.join(set(result['found_left'])))
+                    st.write("**Left:** " + ', '.join(result['found_left']))
             with col2:
                 if result['found_neutral']:
-                    st.write("**Neutral:** " + ', '.join(set(result['found_neutral'])))
+                    st.write("**Neutral:** " + ', '.join(result['found_neutral']))
             with col3:
                 if result['found_right']:
-                    st.write("**Right:** " + ', '.join(set(result['found_right'])))
+                    st.write("**Right:** " + ', '.join(result['found_right']))
         else:
             st.warning("Please enter some text.")
 
@@ -186,38 +100,38 @@ elif mode == "Batch Processing":
         
         if 'text' in df.columns:
             if st.button("🔍 Analyze All", type="primary"):
-                results = []
                 progress_bar = st.progress(0)
                 
-                for idx, text in enumerate(df['text']):
-                    result = detect_political_bias(str(text))
-                    results.append({
-                        'text': result['text'][:60] + '...',
-                        'bias': result['bias_display'],
-                        'confidence': result['confidence']
-                    })
-                    progress_bar.progress((idx + 1) / len(df))
+                # Lowercase the whole column once, as a plain list the scanner
+                # can consume without per-row coercion
+                text_col = df['text'].astype(str)
+                lowers = text_col.str.lower().tolist()
+                scored = []
+                # Each progress update is a round-trip to the browser; send ~100
+                step = max(1, len(df) // 100)
+                for idx, text_lower in enumerate(lowers):
+                    scored.append(batch_row(text_lower))
+                    if idx % step == 0 or idx == len(df) - 1:
+                        progress_bar.progress((idx + 1) / len(df))
                 
-                results_df = pd.DataFrame(results)
+                results_df = pd.DataFrame(scored, columns=['bias_label', 'bias', 'confidence'])
+                results_df.insert(0, 'text', (text_col.str.slice(0, 60) + '...').to_numpy())
                 st.success(f"✅ Analyzed {len(results_df)} texts!")
                 
+                bias_totals = results_df['bias_label'].value_counts()
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
                     st.metric("Total", len(results_df))
                 with col2:
-                    left = len(results_df[results_df['bias'].str.contains('Left')])
-                    st.metric("Left", left)
+                    st.metric("Left", int(bias_totals.get('left', 0)))
                 with col3:
-                    center = len(results_df[results_df['bias'].str.contains('Center')])
-                    st.metric("Center", center)
+                    st.metric("Center", int(bias_totals.get('center', 0)))
                 with col4:
-                    right = len(results_df[results_df['bias'].str.contains('Right')])
-                    st.metric("Right", right)
+                    st.metric("Right", int(bias_totals.get('right', 0)))
                 
-                bias_counts = results_df['bias'].value_counts()
-                fig = px.pie(values=bias_counts.values, names=bias_counts.index,
-                            title='Bias Distribution')
-                st.plotly_chart(fig, use_container_width=True)
+                # Counts are already aggregated; a native chart avoids shipping a Plotly figure
+                st.subheader("📊 Bias Distribution")
+                st.bar_chart(bias_totals)
                 
                 st.dataframe(results_df, use_container_width=True)
                 csv = results_df.to_csv(index=False)
@@ -254,6 +168,7 @@ else:
         for idx, row in results_df.iterrows():
             st.info(f"{row['bias']} ({row['confidence']:.1%}): {row['text']}")
         
+        import plotly.express as px
         fig = px.bar(results_df, x=results_df.index, y='confidence',
                      title='Confidence Scores',
                      color='confidence', color_continuous_scale='Viridis')
@@ -0,0 +1,142 @@
+"""
+Political bias scoring for NLP App 018
+Kept apart from the Streamlit UI in app.py
+"""
+
+from collections import Counter
+
+# Political bias keywords (simplified for demonstration)
+BIAS_KEYWORDS = {
+    'left': ['progressive', 'liberal', 'social justice', 'equality', 'diversity', 'climate change', 'universal healthcare', 'reform', 'regulation', 'workers rights'],
+    'right': ['conservative', 'traditional', 'freedom', 'liberty', 'free market', 'deregulation', 'law and order', 'strong borders', 'family values', 'fiscal responsibility'],
+    'neutral': ['according to', 'reported', 'stated', 'analysis shows', 'data indicates', 'research suggests', 'officials say', 'experts note']
+}
+
+# Weight per keyword hit for each bias category
+KEYWORD_WEIGHTS = {'left': 0.4, 'right': 0.4, 'neutral': 0.3}
+
+# Emotional vs factual language
+EMOTIONAL_WORDS = ['outrageous', 'shocking', 'terrible', 'wonderful', 'amazing', 'horrific']
+
+# Flat keyword lookup built once at import: keyword -> (category, weight)
+KEYWORD_TABLE = {
+    keyword: (category, KEYWORD_WEIGHTS[category])
+    for category, keywords in BIAS_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# Every distinct keyword, so each one is scanned for once per text
+ALL_KEYWORDS = tuple(dict.fromkeys([*KEYWORD_TABLE, *EMOTIONAL_WORDS]))
+KEYWORD_RANK = {keyword: rank for rank, keyword in enumerate(ALL_KEYWORDS)}
+
+# Built once per process, when this module is first imported
+def build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over keywords (None without pyahocorasick)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, (keyword, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton(ALL_KEYWORDS)
+
+def find_keywords(text_lower):
+    """Count the occurrences of every known keyword present in lowercased text"""
+    present = {}
+    if KEYWORD_AUTOMATON is not None:
+        # Single pass over the text; overlapping repeats of the same keyword
+        # are skipped so counts match str.count()
+        next_start = {}
+        for end, (keyword, length) in KEYWORD_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if start >= next_start.get(keyword, 0):
+                present[keyword] = present.get(keyword, 0) + 1
+                next_start[keyword] = end + 1
+        return present
+    for keyword in ALL_KEYWORDS:
+        count = text_lower.count(keyword)
+        if count:
+            present[keyword] = count
+    return present
+
+def _score_lower(text_lower):
+    """Score text that has already been lowercased"""
+    words = text_lower.split()
+    word_count = len(words)
+    
+    scores = dict.fromkeys(BIAS_KEYWORDS, 0)
+    found = {category: Counter() for category in BIAS_KEYWORDS}
+    
+    # Find every keyword once; everything below only looks up the hits
+    present = find_keywords(text_lower)
+    
+    # Walk the hits in keyword-list order, keeping the float sums that
+    # decide between categories identical to per-list loops
+    for keyword in sorted(present, key=KEYWORD_RANK.__getitem__):
+        if keyword in KEYWORD_TABLE:
+            category, weight = KEYWORD_TABLE[keyword]
+            count = present[keyword]
+            scores[category] += count * weight
+            found[category][keyword] = count
+    
+    left_score = scores['left']
+    right_score = scores['right']
+    neutral_score = scores['neutral']
+    found_left = found['left']
+    found_right = found['right']
+    found_neutral = found['neutral']
+    
+    emotional_count = sum(1 for word in EMOTIONAL_WORDS if word in present)
+    if emotional_count > 2:
+        # Emotional language reduces neutrality
+        neutral_score -= 0.3
+    
+    # Determine bias
+    total_score = left_score + right_score + neutral_score
+    
+    if total_score == 0 or neutral_score > (left_score + right_score):
+        bias = 'center'
+        bias_display = '⚪ Center/Neutral'
+        lean_score = 0
+    elif left_score > right_score:
+        bias = 'left'
+        bias_display = '🔵 Left/Liberal'
+        lean_score = (left_score / max(total_score, 0.1)) * 100
+    else:
+        bias = 'right'
+        bias_display = '🔴 Right/Conservative'
+        lean_score = (right_score / max(total_score, 0.1)) * 100
+    
+    # Confidence
+    if total_score == 0:
+        confidence = 0.5
+    else:
+        max_score = max(left_score, right_score, neutral_score)
+        confidence = max_score / total_score
+    
+    return {
+        'bias': bias,
+        'bias_display': bias_display,
+        'lean_score': lean_score,
+        'confidence': confidence,
+        'left_score': left_score,
+        'right_score': right_score,
+        'neutral_score': neutral_score,
+        'found_left': found_left,
+        'found_right': found_right,
+        'found_neutral': found_neutral,
+        'word_count': word_count
+    }
+
+def detect_political_bias(text):
+    """Detect political bias in text"""
+    return {'text': text, **_score_lower(text.lower())}
+
+def batch_row(text_lower):
+    """Reduce a score to the columns shown in the batch table"""
+    result = _score_lower(text_lower)
+    return result['bias'], result['bias_display'], result['confidence']
@@ -0,0 +1,186 @@
+"""
+Clickbait scoring for NLP App 019
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+# Clickbait patterns
+CLICKBAIT_PATTERNS = {
+    'question_hooks': ['will', 'can', 'should', 'what', 'why', 'how', 'who', 'when', 'where', 'which'],
+    'numbered_lists': [r'\d+\s+(?:ways|reasons|things|facts|secrets|tips|tricks)', r'top\s+\d+', r'\d+\s+of\s+the'],
+    'sensational': ['shocking', 'unbelievable', 'amazing', 'incredible', 'mind-blowing', 'jaw-dropping', 'outrageous', 'insane'],
+    'urgency': ['now', 'today', 'urgent', 'breaking', 'just', 'finally', 'dont miss', 'last chance'],
+    'direct_address': ['you wont believe', 'you need', 'you have to', 'youll never', 'this will', 'you must see']
+}
+
+# Compiled once; each pattern that matches scores separately, so they are not merged into one alternation
+NUMBERED_LIST_RES = tuple(re.compile(pattern) for pattern in CLICKBAIT_PATTERNS['numbered_lists'])
+
+# Every plain keyword, so each one is scanned for once per text
+ALL_KEYWORDS = tuple(dict.fromkeys(
+    word
+    for category in ('question_hooks', 'sensational', 'urgency', 'direct_address')
+    for word in CLICKBAIT_PATTERNS[category]
+))
+
+# Built once per process, when this module is first imported
+def build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over keywords (None without pyahocorasick)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, (keyword, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton(ALL_KEYWORDS)
+
+def find_keywords(text_lower):
+    """Count the occurrences of every keyword present in lowercased text"""
+    present = {}
+    if KEYWORD_AUTOMATON is not None:
+        # Single pass over the text; overlapping repeats of the same keyword
+        # are skipped so counts match str.count()
+        next_start = {}
+        for end, (keyword, length) in KEYWORD_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if start >= next_start.get(keyword, 0):
+                present[keyword] = present.get(keyword, 0) + 1
+                next_start[keyword] = end + 1
+        return present
+    for keyword in ALL_KEYWORDS:
+        count = text_lower.count(keyword)
+        if count:
+            present[keyword] = count
+    return present
+
+def _score_indicators(text, text_lower, words, scale, stop_at_saturation=False):
+    """Sum the clickbait indicator scores and collect what was found
+    
+    Every indicator only adds to the score, so once score * scale reaches
+    1.0 the clamped probability is final. With stop_at_saturation the
+    remaining regex and caps scans are skipped from that point, leaving
+    the found indicators incomplete.
+    """
+    # Clickbait scores
+    clickbait_score = 0
+    found_indicators = {}
+    
+    # Questions (especially at start)
+    if text.strip().endswith('?'):
+        clickbait_score += 0.4
+        found_indicators['question_mark'] = ['?']
+    
+    # Count every keyword once, then score each category from the counts
+    present = find_keywords(text_lower)
+    
+    # Question words
+    hooks_found = [w for w in CLICKBAIT_PATTERNS['question_hooks'] if w in present]
+    if hooks_found:
+        clickbait_score += len(hooks_found) * 0.15
+        found_indicators['question_words'] = hooks_found
+    
+    if stop_at_saturation and clickbait_score * scale >= 1.0:
+        return clickbait_score, found_indicators
+    
+    # Numbered lists
+    for pattern in NUMBERED_LIST_RES:
+        if pattern.search(text_lower):
+            clickbait_score += 0.5
+            found_indicators['numbered_lists'] = ['list pattern']
+    
+    # Sensational words (indicator lists hold each entry once, in first-seen order)
+    sensational_found = []
+    for word in CLICKBAIT_PATTERNS['sensational']:
+        count = present.get(word)
+        if count:
+            clickbait_score += count * 0.3
+            sensational_found.append(word)
+    if sensational_found:
+        found_indicators['sensational'] = sensational_found
+    
+    # Urgency words
+    urgency_found = []
+    for word in CLICKBAIT_PATTERNS['urgency']:
+        count = present.get(word)
+        if count:
+            clickbait_score += count * 0.2
+            urgency_found.append(word)
+    if urgency_found:
+        found_indicators['urgency'] = urgency_found
+    
+    # Direct address patterns
+    direct_found = []
+    for phrase in CLICKBAIT_PATTERNS['direct_address']:
+        if phrase in present:
+            clickbait_score += 0.4
+            direct_found.append(phrase)
+    if direct_found:
+        found_indicators['direct_address'] = direct_found
+    
+    if stop_at_saturation and clickbait_score * scale >= 1.0:
+        return clickbait_score, found_indicators
+    
+    # All caps words
+    caps_words = [w for w in words if w.isupper() and len(w) > 2]
+    if caps_words:
+        clickbait_score += len(caps_words) * 0.2
+        found_indicators['caps'] = list(dict.fromkeys(caps_words))
+    
+    # Excessive punctuation
+    exc_count = text.count('!')
+    if exc_count > 1:
+        clickbait_score += exc_count * 0.15
+    
+    return clickbait_score, found_indicators
+
+def detect_clickbait(text, sensitivity=0.5, stop_at_saturation=False):
+    """Detect clickbait in headlines/titles"""
+    text_lower = text.lower()
+    # Lowercasing never changes whitespace, so one split of the original
+    # text gives the word count and the tokens for the caps check
+    words = text.split()
+    word_count = len(words)
+    
+    scale = 0.7 + sensitivity * 0.6
+    clickbait_score, found_indicators = _score_indicators(text, text_lower, words, scale, stop_at_saturation)
+    
+    # Adjust by sensitivity
+    clickbait_probability = min(clickbait_score * scale, 1.0)
+    
+    # Classification
+    if clickbait_probability >= 0.7:
+        classification = "🎣 High Clickbait"
+        risk = "High"
+    elif clickbait_probability >= 0.5:
+        classification = "⚠️ Likely Clickbait"
+        risk = "Medium"
+    elif clickbait_probability >= 0.3:
+        classification = "🤔 Possibly Clickbait"
+        risk = "Low"
+    else:
+        classification = "✅ Not Clickbait"
+        risk = "Minimal"
+    
+    return {
+        'text': text,
+        'clickbait_probability': clickbait_probability,
+        'classification': classification,
+        'risk': risk,
+        'found_indicators': found_indicators,
+        'word_count': word_count
+    }
+
+def batch_row(text, sensitivity):
+    """Reduce a result to the columns shown in the batch table"""
+    # The table has no indicator column, so saturated rows can stop early
+    result = detect_clickbait(text, sensitivity, stop_at_saturation=True)
+    return result['classification'], result['clickbait_probability']
+
+def score_chunk(texts, sensitivity):
+    """Score a chunk of texts for the batch table"""
+    return [batch_row(text, sensitivity) for text in texts]
@@ -6,10 +6,8 @@ Real-world use case: Fake review detection
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import re
-from collections import Counter
+
+from review_scoring import analyze_review_authenticity, score_chunk
 
 st.set_page_config(
     page_title="Review Authenticity",
@@ -39,103 +37,31 @@ st.sidebar.markdown("""
 - 🤖 Generic Language
 """)
 
-# Authenticity patterns
-FAKE_INDICATORS = ['best product ever', 'highly recommend', 'must buy', 'amazing product', 'life changing', 'perfect', 'excellent quality']
-SPAM_PATTERNS = ['click here', 'visit', 'check out', 'limited time', 'discount', 'promo', 'coupon']
-AUTHENTIC_INDICATORS = ['however', 'but', 'although', 'wish', 'could be better', 'pros and cons', 'disappointed', 'satisfied']
+# Single Input and Demo reruns with unchanged inputs reuse the last result;
+# batch rows call analyze_review_authenticity() directly so they do not flood the cache
+@st.cache_data(max_entries=1024, show_spinner=False)
+def analyze_review_authenticity_cached(text):
+    """Memoized analyze_review_authenticity() for the interactive modes"""
+    return analyze_review_authenticity(text)
 
-def analyze_review_authenticity(text):
-    """Analyze review authenticity"""
-    text_lower = text.lower()
-    words = text_lower.split()
-    word_count = len(words)
-    
-    # Scoring
-    fake_score = 0
-    authentic_score = 0
-    found_indicators = {}
-    
-    # Check for overly positive/generic language
-    fake_found = []
-    for phrase in FAKE_INDICATORS:
-        if phrase in text_lower:
-            fake_score += 0.4
-            fake_found.append(phrase)
-    if fake_found:
-        found_indicators['fake_indicators'] = fake_found
-    
-    # Check for spam patterns
-    spam_found = []
-    for pattern in SPAM_PATTERNS:
-        if pattern in text_lower:
-            fake_score += 0.5
-            spam_found.append(pattern)
-    if spam_found:
-        found_indicators['spam_patterns'] = spam_found
-    
-    # Check for authentic indicators
-    authentic_found = []
-    for indicator in AUTHENTIC_INDICATORS:
-        if indicator in text_lower:
-            authentic_score += 0.3
-            authentic_found.append(indicator)
-    if authentic_found:
-        found_indicators['authentic_indicators'] = authentic_found
-    
-    # Length check (very short = suspicious)
-    if word_count < 10:
-        fake_score += 0.3
-    elif word_count > 30:
-        authentic_score += 0.2
-    
-    # Specificity (numbers, dates, specific details)
-    numbers = re.findall(r'\b\d+\b', text)
-    if len(numbers) > 0:
-        authentic_score += len(numbers) * 0.15
-    
-    # Personal pronouns (I, my, me = more authentic)
-    personal = sum(1 for word in ['i ', 'my ', 'me ', 'mine '] if word in text_lower)
-    authentic_score += personal * 0.2
-    
-    # ALL CAPS (spam indicator)
-    caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
-    if caps_ratio > 0.3:
-        fake_score += 0.4
-    
-    # Excessive punctuation
-    if text.count('!') > 3:
-        fake_score += 0.3
-    
-    # Calculate authenticity
-    if fake_score > authentic_score:
-        authenticity_score = max(0, 1 - (fake_score / max(fake_score + authentic_score, 0.1)))
-    else:
-        authenticity_score = min(1, authentic_score / max(fake_score + authentic_score, 0.1))
-    
-    # Classification
-    if authenticity_score >= 0.7:
-        classification = "✅ Likely Authentic"
-        trust = "High"
-    elif authenticity_score >= 0.5:
-        classification = "🟡 Moderately Authentic"
-        trust = "Medium"
-    elif authenticity_score >= 0.3:
-        classification = "⚠️ Questionable"
-        trust = "Low"
-    else:
-        classification = "🚫 Likely Fake/Spam"
-        trust = "Very Low"
-    
-    return {
-        'text': text,
-        'authenticity_score': authenticity_score,
-        'classification': classification,
-        'trust': trust,
-        'fake_score': fake_score,
-        'authentic_score': authentic_score,
-        'found_indicators': found_indicators,
-        'word_count': word_count
-    }
+# Batch rows are scored a chunk at a time, with one progress update per chunk
+BATCH_CHUNK_ROWS = 1000
+
+# Uploaded CSVs are parsed this many rows at a time, so batch mode holds one
+# chunk of the text column in memory rather than the whole file
+CSV_CHUNK_ROWS = 10_000
+
+def read_csv_chunks(uploaded_file, text_only=True):
+    """Parse an uploaded CSV from the start, a chunk of rows at a time
+    
+    With text_only just the text column is parsed, read as strings so
+    every chunk types it the same way.
+    """
+    uploaded_file.seek(0)
+    if text_only:
+        return pd.read_csv(uploaded_file, usecols=lambda c: c == 'text', dtype={'text': str},
+                           chunksize=CSV_CHUNK_ROWS)
+    return pd.read_csv(uploaded_file, chunksize=CSV_CHUNK_ROWS)
 
 # Mode: Single Input
 if mode == "Single Input":
@@ -150,7 +76,7 @@ if mode == "Single Input":
     if st.button("🔍 Analyze Review", type="primary"):
         if user_input.strip():
             with st.spinner("Analyzing..."):
-                result = analyze_review_authenticity(user_input)
+                result = analyze_review_authenticity_cached(user_input)
             
             st.success("✅ Analysis Complete!")
             
@@ -163,6 +89,7 @@ if mode == "Single Input":
                 st.metric("Trust Level", result['trust'])
             
             st.subheader("📊 Authenticity Score")
+            import plotly.graph_objects as go
             fig = go.Figure(go.Indicator(
                 mode="gauge+number",
                 value=result['authenticity_score'] * 100,
@@ -191,37 +118,42 @@ elif mode == "Batch Processing":
     uploaded_file = st.file_uploader("Upload CSV with 'text' column", type=['csv'])
     
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        st.write(f"Loaded {len(df)} rows")
+        # Count rows a chunk at a time; without a text column every column is
+        # parsed so the count and error below still describe the file
+        has_text = 'text' in pd.read_csv(uploaded_file, nrows=0).columns
+        n_rows = sum(len(chunk) for chunk in read_csv_chunks(uploaded_file, text_only=has_text))
+        st.write(f"Loaded {n_rows} rows")
         
-        if 'text' in df.columns:
+        if has_text:
             if st.button("🔍 Analyze All", type="primary"):
-                results = []
                 progress_bar = st.progress(0)
                 
-                for idx, text in enumerate(df['text']):
-                    result = analyze_review_authenticity(str(text))
-                    results.append({
-                        'text': result['text'][:60] + '...',
-                        'classification': result['classification'],
-                        'authenticity': result['authenticity_score'],
-                        'trust': result['trust']
-                    })
-                    progress_bar.progress((idx + 1) / len(df))
+                previews = []
+                scored = []
+                for chunk in read_csv_chunks(uploaded_file):
+                    # Coerce each chunk once; previews are sliced chunk-wide
+                    text_col = chunk['text'].astype(str)
+                    previews.append((text_col.str.slice(0, 60) + '...').to_numpy())
+                    texts = text_col.tolist()
+                    for i in range(0, len(texts), BATCH_CHUNK_ROWS):
+                        scored.extend(score_chunk(texts[i:i + BATCH_CHUNK_ROWS]))
+                        progress_bar.progress(len(scored) / n_rows)
                 
-                results_df = pd.DataFrame(results)
+                results_df = pd.DataFrame(scored, columns=['classification', 'authenticity', 'trust'])
+                results_df.insert(0, 'text', np.concatenate(previews))
                 st.success(f"✅ Analyzed {len(results_df)} reviews!")
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total", len(results_df))
                 with col2:
-                    authentic = len(results_df[results_df['authenticity'] >= 0.7])
+                    authentic = int((results_df['authenticity'] >= 0.7).sum())
                     st.metric("Authentic", authentic)
                 with col3:
-                    fake = len(results_df[results_df['authenticity'] < 0.3])
+                    fake = int((results_df['authenticity'] < 0.3).sum())
                     st.metric("Likely Fake", fake)
                 
+                import plotly.express as px
                 fig = px.histogram(results_df, x='authenticity', nbins=20,
                                   title='Authenticity Distribution')
                 st.plotly_chart(fig, use_container_width=True)
@@ -248,7 +180,7 @@ else:
     if st.button("🚀 Run Demo", type="primary"):
         results = []
         for text in samples:
-            result = analyze_review_authenticity(text)
+            result = analyze_review_authenticity_cached(text)
             results.append({
                 'text': text[:60] + '...',
                 'classification': result['classification'],
@@ -262,6 +194,7 @@ else:
             st.info(f"{row['classification']} ({row['authenticity']:.1%})")
             st.caption(row['text'])
         
+        import plotly.express as px
         fig = px.bar(results_df, x=results_df.index, y='authenticity',
                      title='Authenticity Scores',
                      color='authenticity', color_continuous_scale='RdYlGn')
@@ -0,0 +1,153 @@
+"""
+Review authenticity scoring for NLP App 020
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+import sys
+
+# Authenticity patterns
+FAKE_INDICATORS = ['best product ever', 'highly recommend', 'must buy', 'amazing product', 'life changing', 'perfect', 'excellent quality']
+SPAM_PATTERNS = ['click here', 'visit', 'check out', 'limited time', 'discount', 'promo', 'coupon']
+AUTHENTIC_INDICATORS = ['however', 'but', 'although', 'wish', 'could be better', 'pros and cons', 'disappointed', 'satisfied']
+PERSONAL_PRONOUNS = ['i ', 'my ', 'me ', 'mine ']
+NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Every phrase, so each one is scanned for once per text
+ALL_PHRASES = tuple(dict.fromkeys([*FAKE_INDICATORS, *SPAM_PATTERNS, *AUTHENTIC_INDICATORS, *PERSONAL_PRONOUNS]))
+
+# Built once per process, when this module is first imported
+def build_phrase_automaton(phrases):
+    """Build an Aho-Corasick automaton over phrases (None without pyahocorasick)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+PHRASE_AUTOMATON = build_phrase_automaton(ALL_PHRASES)
+
+def find_phrases(text_lower):
+    """Return the set of known phrases that occur in lowercased text"""
+    if PHRASE_AUTOMATON is not None:
+        # Single pass over the text instead of one substring scan per phrase
+        return {phrase for _, phrase in PHRASE_AUTOMATON.iter(text_lower)}
+    return {phrase for phrase in ALL_PHRASES if phrase in text_lower}
+
+# Built once per process, when this module is first imported: walks every code point
+def build_uppercase_table():
+    """Map every uppercase character to None, for counting them with str.translate"""
+    return dict.fromkeys(cp for cp in range(sys.maxunicode + 1) if chr(cp).isupper())
+
+UPPERCASE_DELETE = build_uppercase_table()
+
+def analyze_review_authenticity(text):
+    """Analyze review authenticity"""
+    text_lower = text.lower()
+    words = text_lower.split()
+    word_count = len(words)
+    
+    # Scoring
+    fake_score = 0
+    authentic_score = 0
+    found_indicators = {}
+    
+    # Find every phrase once; the checks below only look up the result
+    present = find_phrases(text_lower)
+    
+    # Check for overly positive/generic language
+    fake_found = []
+    for phrase in FAKE_INDICATORS:
+        if phrase in present:
+            fake_score += 0.4
+            fake_found.append(phrase)
+    if fake_found:
+        found_indicators['fake_indicators'] = fake_found
+    
+    # Check for spam patterns
+    spam_found = []
+    for pattern in SPAM_PATTERNS:
+        if pattern in present:
+            fake_score += 0.5
+            spam_found.append(pattern)
+    if spam_found:
+        found_indicators['spam_patterns'] = spam_found
+    
+    # Check for authentic indicators
+    authentic_found = []
+    for indicator in AUTHENTIC_INDICATORS:
+        if indicator in present:
+            authentic_score += 0.3
+            authentic_found.append(indicator)
+    if authentic_found:
+        found_indicators['authentic_indicators'] = authentic_found
+    
+    # Length check (very short = suspicious)
+    if word_count < 10:
+        fake_score += 0.3
+    elif word_count > 30:
+        authentic_score += 0.2
+    
+    # Specificity (numbers, dates, specific details)
+    numbers = NUMBER_RE.findall(text)
+    if len(numbers) > 0:
+        authentic_score += len(numbers) * 0.15
+    
+    # Personal pronouns (I, my, me = more authentic)
+    personal = sum(1 for word in PERSONAL_PRONOUNS if word in present)
+    authentic_score += personal * 0.2
+    
+    # ALL CAPS (spam indicator)
+    # Deleting uppercase characters in C counts them without a per-character loop
+    upper_count = len(text) - len(text.translate(UPPERCASE_DELETE))
+    caps_ratio = upper_count / max(len(text), 1)
+    if caps_ratio > 0.3:
+        fake_score += 0.4
+    
+    # Excessive punctuation
+    if text.count('!') > 3:
+        fake_score += 0.3
+    
+    # Calculate authenticity
+    if fake_score > authentic_score:
+        authenticity_score = max(0, 1 - (fake_score / max(fake_score + authentic_score, 0.1)))
+    else:
+        authenticity_score = min(1, authentic_score / max(fake_score + authentic_score, 0.1))
+    
+    # Classification
+    if authenticity_score >= 0.7:
+        classification = "✅ Likely Authentic"
+        trust = "High"
+    elif authenticity_score >= 0.5:
+        classification = "🟡 Moderately Authentic"
+        trust = "Medium"
+    elif authenticity_score >= 0.3:
+        classification = "⚠️ Questionable"
+        trust = "Low"
+    else:
+        classification = "🚫 Likely Fake/Spam"
+        trust = "Very Low"
+    
+    return {
+        'text': text,
+        'authenticity_score': authenticity_score,
+        'classification': classification,
+        'trust': trust,
+        'fake_score': fake_score,
+        'authentic_score': authentic_score,
+        'found_indicators': found_indicators,
+        'word_count': word_count
+    }
+
+def batch_row(text):
+    """Reduce a result to the columns shown in the batch table"""
+    result = analyze_review_authenticity(text)
+    return result['classification'], result['authenticity_score'], result['trust']
+
+def score_chunk(texts):
+    """Score a chunk of texts for the batch table"""
+    return [batch_row(text) for text in texts]
@@ -48,16 +48,24 @@ SKILLS_DB = ['python', 'java', 'javascript', 'react', 'angular', 'vue', 'node',
 EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'doctorate', 'degree', 'university', 'college',
                       'diploma', 'certificate', 'bsc', 'msc', 'ba', 'ma', 'mba', 'engineering']
 
+# Any education keyword, matched anywhere in a line (not only as a whole word)
+EDUCATION_RE = re.compile('|'.join(re.escape(keyword) for keyword in EDUCATION_KEYWORDS))
+
+# Contact and date patterns
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?(\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b')
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
 def parse_resume(text):
     """Parse resume and extract key information"""
     text_lower = text.lower()
     lines = text.split('\n')
 
     # Extract emails
-    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    emails = EMAIL_RE.findall(text)
 
     # Extract phone numbers
-    phones = re.findall(r'\b(?:\+?\d{1,3}[-.\s]?)?(\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b', text)
+    phones = PHONE_RE.findall(text)
 
     # Extract skills
     found_skills = []
@@ -65,15 +73,25 @@ def parse_resume(text):
         if skill in text_lower:
             found_skills.append(skill)
 
-    # Extract education
+    # Extract education: the first 5 lines mentioning a keyword. Each is found
+    # by one search over the lowercased text (lower() keeps newlines in
+    # place, so counting them gives the line number)
     education = []
-    for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in EDUCATION_KEYWORDS):
-            education.append(line.strip())
+    pos = line_no = 0
+    while len(education) < 5:
+        match = EDUCATION_RE.search(text_lower, pos)
+        if match is None:
+            break
+        line_no += text_lower.count('\n', pos, match.start())
+        education.append(lines[line_no].strip())
+        # Carry on from the start of the next line
+        pos = text_lower.find('\n', match.end()) + 1
+        if pos == 0:
+            break
+        line_no += 1
 
     # Extract dates (years)
-    years = re.findall(r'\b(19|20)\d{2}\b', text)
+    years = YEAR_RE.findall(text)
 
     # Estimate experience years
     if years:
@@ -88,12 +106,35 @@ def parse_resume(text):
         'phones': phones,
         'skills': found_skills,
         'skill_count': len(found_skills),
-        'education': education[:5],  # Top 5
+        'education': education,
         'years_mentioned': sorted(set(years), reverse=True),
         'estimated_experience': experience_years,
         'total_lines': len(lines)
     }
 
+# Single Input and Demo reruns with unchanged inputs reuse the last result;
+# batch rows call parse_resume() directly so they do not flood the cache
+@st.cache_data(max_entries=1024, show_spinner=False)
+def parse_resume_cached(text):
+    """Memoized parse_resume() for the interactive modes"""
+    return parse_resume(text)
+
+# Uploaded CSVs are parsed this many rows at a time, so batch mode holds one
+# chunk of the text column in memory rather than the whole file
+CSV_CHUNK_ROWS = 10_000
+
+def read_csv_chunks(uploaded_file, text_only=True):
+    """Parse an uploaded CSV from the start, a chunk of rows at a time
+
+    With text_only just the text column is parsed, read as strings so
+    every chunk types it the same way.
+    """
+    uploaded_file.seek(0)
+    if text_only:
+        return pd.read_csv(uploaded_file, usecols=lambda c: c == 'text', dtype={'text': str},
+                           chunksize=CSV_CHUNK_ROWS)
+    return pd.read_csv(uploaded_file, chunksize=CSV_CHUNK_ROWS)
+
 # Mode: Single Input
 if mode == "Single Input":
     st.header("📝 Single Text Processing")
@@ -107,7 +148,7 @@ if mode == "Single Input":
     if st.button("🔍 Parse Resume", type="primary"):
         if user_input.strip():
             with st.spinner("Parsing..."):
-                result = parse_resume(user_input)
+                result = parse_resume_cached(user_input)
 
             st.success("✅ Parsing Complete!")
 
@@ -149,22 +190,29 @@ elif mode == "Batch Processing":
     uploaded_file = st.file_uploader("Upload CSV with 'text' column", type=['csv'])
 
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        st.write(f"Loaded {len(df)} rows")
+        # Count rows a chunk at a time; without a text column every column is
+        # parsed so the count and error below still describe the file
+        has_text = 'text' in pd.read_csv(uploaded_file, nrows=0).columns
+        n_rows = sum(len(chunk) for chunk in read_csv_chunks(uploaded_file, text_only=has_text))
+        st.write(f"Loaded {n_rows} rows")
 
-        if 'text' in df.columns:
+        if has_text:
             if st.button("🔍 Parse All", type="primary"):
                 results = []
                 progress_bar = st.progress(0)
-
-                for idx, text in enumerate(df['text']):
-                    result = parse_resume(str(text))
-                    results.append({
-                        'skills': result['skill_count'],
-                        'emails': len(result['emails']),
-                        'experience': result['estimated_experience']
-                    })
-                    progress_bar.progress((idx + 1) / len(df))
+                # Each progress update is a round-trip to the browser; send ~100
+                step = max(1, n_rows // 100)
+
+                for chunk in read_csv_chunks(uploaded_file):
+                    for text in chunk['text']:
+                        result = parse_resume(str(text))
+                        results.append({
+                            'skills': result['skill_count'],
+                            'emails': len(result['emails']),
+                            'experience': result['estimated_experience']
+                        })
+                        if len(results) % step == 0 or len(results) == n_rows:
+                            progress_bar.progress(len(results) / n_rows)
 
                 results_df = pd.DataFrame(results)
                 st.success(f"✅ Parsed {len(results_df)} resumes!")
@@ -208,7 +256,7 @@ SKILLS
 Python, JavaScript, React, Node.js, AWS, Docker, Git, SQL, Machine Learning"""
 
     if st.button("🚀 Run Demo", type="primary"):
-        result = parse_resume(sample)
+        result = parse_resume_cached(sample)
 
         st.success("✅ Demo Complete!")
         st.metric("Skills Found", result['skill_count'])
@@ -0,0 +1,36 @@
+"""
+Phone number extraction for NLP App 027
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+# (555) 123-4567 or 555-123-4567
+PHONE_RE = re.compile(r'\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4}')
+# International: +1-555-123-4567
+INTL_PHONE_RE = re.compile(r'\+\d{1,3}[-\s.]?\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4}')
+
+# Both patterns need digits, so text without one can skip them
+DIGIT_RE = re.compile(r'\d')
+
+def extract_phones(text):
+    """Extract phone numbers"""
+    if DIGIT_RE.search(text) is None:
+        return {'phones': [], 'count': 0}
+    
+    phones = []
+    phones.extend(PHONE_RE.findall(text))
+    phones.extend(INTL_PHONE_RE.findall(text))
+    
+    # Distinct numbers, in the order they were found
+    unique_phones = list(dict.fromkeys(phones))
+    return {'phones': unique_phones, 'count': len(unique_phones)}
+
+def extract_chunk(texts):
+    """Distinct phone numbers in a Series of texts"""
+    texts = texts[texts.str.contains(DIGIT_RE)]
+    phones = set()
+    for pattern in (PHONE_RE, INTL_PHONE_RE):
+        for found in texts.str.findall(pattern):
+            phones.update(found)
+    return phones
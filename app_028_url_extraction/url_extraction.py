@@ -0,0 +1,34 @@
+"""
+URL extraction for NLP App 028
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+# URL and domain patterns
+URL_RE = re.compile(r'https?://[^\s]+|www\.[^\s]+', re.I)
+DOMAIN_RE = re.compile(r'(?:https?://)?(?:www\.)?([^/\s]+)')
+
+def has_url_marker(text):
+    """Whether the text has '://' or 'www.' (any case), which every URL needs"""
+    return '://' in text or 'www.' in text.lower()
+
+def extract_urls(text):
+    """Extract URLs"""
+    if not has_url_marker(text):
+        return {'urls': [], 'domains': [], 'count': 0}
+    
+    urls = URL_RE.findall(text)
+    domains = []
+    for url in urls:
+        match = DOMAIN_RE.search(url)
+        if match:
+            domains.append(match.group(1))
+    
+    # Distinct domains in the order their URLs appear
+    return {'urls': urls, 'domains': list(dict.fromkeys(domains)), 'count': len(urls)}
+
+def extract_chunk(texts):
+    """URLs in a Series of texts, in order"""
+    texts = texts[texts.map(has_url_marker)]
+    return [url for urls in texts.str.findall(URL_RE) for url in urls]
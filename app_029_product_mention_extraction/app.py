@@ -5,10 +5,8 @@ Real-world use case: Brand/product identification
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import re
+
+from product_extraction import extract_products, extract_chunk
 
 st.set_page_config(
     page_title="Product Mention Extraction",
@@ -29,15 +27,33 @@ st.markdown("""
 st.sidebar.header("⚙️ Configuration")
 mode = st.sidebar.selectbox("Mode", ["Single Input", "Batch Processing", "Demo"])
 
-BRANDS = ['Apple', 'Samsung', 'Google', 'Microsoft', 'Sony', 'Dell', 'HP', 'Lenovo', 'Amazon', 'Nike', 'Adidas']
+# Single Input and Demo reruns with unchanged inputs reuse the last result;
+# batch mode does not go through the cache, so uploads do not flood it
+@st.cache_data(max_entries=1024, show_spinner=False)
+def extract_products_cached(text):
+    """Memoized extract_products() for the interactive modes"""
+    return extract_products(text)
+
+# Uploaded CSVs are parsed this many rows at a time, so batch mode holds one
+# chunk of the text column in memory rather than the whole file
+CSV_CHUNK_ROWS = 10_000
 
-def extract_products(text):
-    """Extract product mentions"""
-    found_brands = [b for b in BRANDS if b.lower() in text.lower()]
-    # Product models: iPhone 15, Galaxy S24, Pixel 8
-    models = re.findall(r'\b(?:iPhone|Galaxy|Pixel|Surface|MacBook|iPad|Kindle)\s*\d+\s*(?:Pro|Max|Ultra|Plus)?\b', text, re.I)
+def read_csv_chunks(uploaded_file, text_only=True):
+    """Parse an uploaded CSV from the start, a chunk of rows at a time
     
-    return {'brands': found_brands, 'models': models, 'total': len(found_brands) + len(models)}
+    With text_only just the text column is parsed, read as strings so
+    every chunk types it the same way.
+    """
+    uploaded_file.seek(0)
+    if text_only:
+        return pd.read_csv(uploaded_file, usecols=lambda c: c == 'text', dtype={'text': str},
+                           chunksize=CSV_CHUNK_ROWS)
+    return pd.read_csv(uploaded_file, chunksize=CSV_CHUNK_ROWS)
+
+def extract_batch(uploaded_file):
+    """Run extract_chunk() over the uploaded texts, yielding results in row order"""
+    for chunk in read_csv_chunks(uploaded_file):
+        yield extract_chunk(chunk['text'].astype(str))
 
 # Mode: Single Input
 if mode == "Single Input":
@@ -51,7 +67,7 @@ if mode == "Single Input":
     
     if st.button("🔍 Extract", type="primary"):
         if user_input.strip():
-            result = extract_products(user_input)
+            result = extract_products_cached(user_input)
             st.success("✅ Complete!")
             
             col1, col2 = st.columns(2)
@@ -78,14 +94,18 @@ elif mode == "Batch Processing":
     uploaded_file = st.file_uploader("Upload CSV with 'text' column", type=['csv'])
     
     if uploaded_file:
-        df = pd.read_csv(uploaded_file)
-        st.write(f"Loaded {len(df)} rows")
+        # Count rows a chunk at a time; without a text column every column is
+        # parsed so the count and error below still describe the file
+        has_text = 'text' in pd.read_csv(uploaded_file, nrows=0).columns
+        n_rows = sum(len(chunk) for chunk in read_csv_chunks(uploaded_file, text_only=has_text))
+        st.write(f"Loaded {n_rows} rows")
         
-        if 'text' in df.columns:
+        if has_text:
             if st.button("🔍 Extract All", type="primary"):
+                # Only brands are counted here, so skip the model scan
                 all_brands = []
-                for text in df['text']:
-                    all_brands.extend(extract_products(str(text))['brands'])
+                for found in extract_batch(uploaded_file):
+                    all_brands.extend(found)
                 st.success(f"✅ Found {len(all_brands)} product mentions!")
                 if all_brands:
                     from collections import Counter
@@ -102,7 +122,7 @@ else:
     sample = "I bought an iPhone 15 Pro and Samsung Galaxy S24. Also considering a Google Pixel 8."
     
     if st.button("🚀 Run Demo", type="primary"):
-        r = extract_products(sample)
+        r = extract_products_cached(sample)
         st.success("✅ Demo Complete!")
         st.write("**Brands:**", r['brands'])
         st.write("**Models:**", r['models'])
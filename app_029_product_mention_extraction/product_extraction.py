@@ -0,0 +1,30 @@
+"""
+Product mention extraction for NLP App 029
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+BRANDS = ['Apple', 'Samsung', 'Google', 'Microsoft', 'Sony', 'Dell', 'HP', 'Lenovo', 'Amazon', 'Nike', 'Adidas']
+
+# Product models: iPhone 15, Galaxy S24, Pixel 8
+MODEL_RE = re.compile(r'\b(?:iPhone|Galaxy|Pixel|Surface|MacBook|iPad|Kindle)\s*\d+\s*(?:Pro|Max|Ultra|Plus)?\b', re.I)
+
+# (brand, lowercased brand) pairs, so matching lowercases only the text
+BRANDS_LOWER = [(b, b.lower()) for b in BRANDS]
+
+def find_brands(text):
+    """Brands mentioned in the text, in BRANDS order"""
+    text_lower = text.lower()
+    return [b for b, b_lower in BRANDS_LOWER if b_lower in text_lower]
+
+def extract_products(text):
+    """Extract product mentions"""
+    found_brands = find_brands(text)
+    models = MODEL_RE.findall(text)
+    
+    return {'brands': found_brands, 'models': models, 'total': len(found_brands) + len(models)}
+
+def extract_chunk(texts):
+    """Brand mentions in a Series of texts"""
+    return [brand for text in texts for brand in find_brands(text)]
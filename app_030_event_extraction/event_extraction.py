@@ -0,0 +1,64 @@
+"""
+Event extraction for NLP App 030
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+EVENT_KEYWORDS = ['conference', 'meeting', 'webinar', 'workshop', 'seminar', 'summit', 'event', 'festival', 'concert', 'expo']
+
+# An event runs from a word start to the end of its run of word and space
+# characters, when the keyword comes later in that run (the pattern
+# rf'\b[A-Z][\w\s]*{keyword}[\w\s]*' with re.I). Finding the last keyword in
+# each run and the first word start before it gives the same matches in
+# linear time; the pattern rescans the rest of the run from every word start.
+WORD_RUN_RE = re.compile(r'[\w\s]+')
+WORD_START_RE = re.compile(r'\b[A-Z]', re.I)
+KEYWORD_RES = [re.compile(keyword, re.I) for keyword in EVENT_KEYWORDS]
+LAST_KEYWORD_RES = [re.compile(rf'.*{keyword}', re.I | re.S) for keyword in EVENT_KEYWORDS]
+DATE_RE = re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}\b', re.I)
+
+def find_events(text):
+    """Yield event mentions for each keyword in turn, in linear time"""
+    runs = None
+    for keyword, keyword_re, last_keyword_re in zip(EVENT_KEYWORDS, KEYWORD_RES, LAST_KEYWORD_RES):
+        # Most texts mention few of the keywords; skip the rest with one
+        # scan each and split the text into runs only once one is found
+        if keyword_re.search(text) is None:
+            continue
+        if runs is None:
+            runs = [run.span() for run in WORD_RUN_RE.finditer(text)]
+        for start, end in runs:
+            last = last_keyword_re.match(text, start, end)
+            if last is None:
+                continue
+            word = WORD_START_RE.search(text, start, last.end() - len(keyword))
+            if word is not None:
+                yield text[word.start():end]
+
+def first_events(text, limit=10):
+    """The first `limit` distinct events, stopping the scan once they are found"""
+    seen = {}
+    for event in find_events(text):
+        seen.setdefault(event, None)
+        if len(seen) == limit:
+            break
+    return list(seen)
+
+def extract_events(text):
+    """Extract events"""
+    # Every match is kept for the total, so this scan runs to the end
+    events = list(find_events(text))
+    
+    # Extract dates
+    dates = DATE_RE.findall(text)
+    
+    # The first 10 distinct events, in the order they were found
+    return {'events': list(dict.fromkeys(events))[:10], 'dates': dates, 'total': len(events)}
+
+def extract_chunk(texts):
+    """Up to 10 distinct events per text in a Series"""
+    events = []
+    for text in texts:
+        events.extend(first_events(text))
+    return events
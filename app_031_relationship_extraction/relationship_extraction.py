@@ -0,0 +1,75 @@
+"""
+Relationship extraction for NLP App 031
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+RELATIONSHIP_PATTERNS = {
+    'employment': ['works for', 'employed by', 'working at', 'hired by'],
+    'management': ['manages', 'supervises', 'leads', 'directs'],
+    'ownership': ['owns', 'founded', 'created', 'established'],
+    'location': ['lives in', 'located in', 'based in', 'from'],
+    'association': ['member of', 'part of', 'belongs to', 'associated with']
+}
+
+# A relationship is a run of capitalized names, the phrase, then another run
+# of names. The name runs are found once per text and each phrase is tried
+# at the end of each run; the phrases are lowercase, so a later name in the
+# same run cannot start a match either. Rescanning the run from each name
+# instead goes quadratic on long runs of names.
+NAME_RUN_RE = re.compile(r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*')
+
+# (type, phrase, pattern) for every relationship phrase; the pattern matches
+# the phrase after a subject and captures the object names
+RELATIONSHIP_REGEXES = [
+    (rel_type, pattern, re.compile(rf'\s+{re.escape(pattern)}\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'))
+    for rel_type, patterns in RELATIONSHIP_PATTERNS.items()
+    for pattern in patterns
+]
+
+def find_relations(text, names, phrase_re):
+    """Find (subject, object) name pairs around one phrase, given the name runs"""
+    pairs = []
+    pos = 0
+    for subject in names:
+        # Runs used up as the object of the previous match are skipped
+        if subject.start() < pos:
+            continue
+        obj = phrase_re.match(text, subject.end())
+        if obj is not None:
+            pairs.append((subject.group(), obj.group(1)))
+            pos = obj.end()
+    return pairs
+
+def extract_relationships(text):
+    """Extract relationships between entities"""
+    relationships = []
+    names = None
+    
+    for rel_type, pattern, regex in RELATIONSHIP_REGEXES:
+        # The phrase appears verbatim in any match, so most phrases are
+        # ruled out by a substring check; names are found on first need
+        if pattern not in text:
+            continue
+        if names is None:
+            names = list(NAME_RUN_RE.finditer(text))
+        # Find sentences with relationship patterns
+        matches = find_relations(text, names, regex)
+        for match in matches:
+            relationships.append({
+                'subject': match[0],
+                'relation': pattern,
+                'object': match[1],
+                'type': rel_type
+            })
+    
+    return {
+        'relationships': relationships,
+        'count': len(relationships),
+        'types': list(set([r['type'] for r in relationships]))
+    }
+
+def extract_chunk(texts):
+    """Relationships in a Series of texts"""
+    return [rel for text in texts for rel in extract_relationships(text)['relationships']]
@@ -0,0 +1,42 @@
+"""
+Keyword extraction for NLP App 032
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+from collections import Counter
+
+STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'is', 'was', 'are', 'were'}
+
+# Capitalized terms (likely important) and words of three letters or more
+CAP_WORD_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+def keyword_counts(text):
+    """Count the words of three or more letters that are not stop words"""
+    words = WORD_RE.findall(text.lower())
+    filtered_words = [w for w in words if w not in STOP_WORDS]
+    return Counter(filtered_words)
+
+def extract_keywords(text, top_n=10):
+    """Extract keywords"""
+    # Capitalized terms (likely important)
+    cap_words = CAP_WORD_RE.findall(text)
+    
+    # Count frequencies
+    word_freq = keyword_counts(text)
+    cap_freq = Counter(cap_words)
+    
+    top_keywords = word_freq.most_common(top_n)
+    top_capitalized = cap_freq.most_common(5)
+    
+    return {
+        'keywords': [w[0] for w in top_keywords],
+        'frequencies': dict(top_keywords),
+        'capitalized': [w[0] for w in top_capitalized],
+        'total_unique': len(word_freq)
+    }
+
+def extract_chunk(texts):
+    """Top five keywords of each text in a Series"""
+    return [word for text in texts for word, _ in keyword_counts(text).most_common(5)]
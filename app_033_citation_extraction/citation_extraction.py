@@ -0,0 +1,38 @@
+"""
+Citation extraction for NLP App 033
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+# (Author, Year) or (Author et al., Year)
+PAREN_CITE_RE = re.compile(r'\(([A-Z][a-z]+(?:\s+et\s+al\.?)?),?\s+(\d{4})\)')
+# [Author, Year] or [1]
+BRACKET_CITE_RE = re.compile(r'\[([A-Z][a-z]+(?:\s+et\s+al\.?)?),?\s+(\d{4})\]|\[(\d+)\]')
+# DOI patterns
+DOI_RE = re.compile(r'10\.\d{4,}/[-._;()/:A-Za-z0-9]+')
+
+def find_citations(text):
+    """Parenthesized then bracketed citations, formatted for display"""
+    paren_cites = PAREN_CITE_RE.findall(text)
+    bracket_cites = BRACKET_CITE_RE.findall(text)
+    
+    citations = [f"{author}, {year}" for author, year in paren_cites]
+    citations.extend([f"{m[0]}, {m[1]}" if m[0] else f"[{m[2]}]" for m in bracket_cites])
+    return citations
+
+def extract_citations(text):
+    """Extract citations"""
+    citations = find_citations(text)
+    dois = DOI_RE.findall(text)
+    
+    return {
+        'citations': citations,
+        'dois': dois,
+        'count': len(citations),
+        'doi_count': len(dois)
+    }
+
+def extract_chunk(texts):
+    """Citations in a Series of texts, in order"""
+    return [cite for text in texts for cite in find_citations(text)]
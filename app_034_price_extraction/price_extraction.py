@@ -0,0 +1,61 @@
+"""
+Price extraction for NLP App 034
+Kept apart from the Streamlit UI in app.py
+"""
+
+import re
+
+# Currency symbols
+DOLLAR_RE = re.compile(r'\$\s*\d+(?:,\d{3})*(?:\.\d{2})?')
+EURO_RE = re.compile(r'€\s*\d+(?:,\d{3})*(?:\.\d{2})?')
+POUND_RE = re.compile(r'£\s*\d+(?:,\d{3})*(?:\.\d{2})?')
+# Written format: 100 USD
+WRITTEN_PRICE_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:USD|EUR|GBP)')
+# Deletes the currency symbols, codes and thousands separators from a price;
+# whitespace only occurs at the ends of a match, so stripping it afterwards
+# leaves just the digits and decimal point
+PRICE_STRIP = str.maketrans('', '', '$€£,USDEURGBP')
+
+# Every price carries one of these, so text without any can skip the scans
+CURRENCY_MARKERS = ('$', '€', '£', 'USD', 'EUR', 'GBP')
+
+def find_prices(text):
+    """Price strings by currency: $, €, £, then written amounts"""
+    if not any(marker in text for marker in CURRENCY_MARKERS):
+        return []
+    
+    prices = []
+    prices.extend(DOLLAR_RE.findall(text))
+    prices.extend(EURO_RE.findall(text))
+    prices.extend(POUND_RE.findall(text))
+    prices.extend(WRITTEN_PRICE_RE.findall(text))
+    return prices
+
+def extract_prices(text):
+    """Extract prices"""
+    prices = find_prices(text)
+    
+    # Parse amounts
+    amounts = []
+    for price in prices:
+        num = price.translate(PRICE_STRIP).strip()
+        if num:
+            try:
+                amounts.append(float(num))
+            except:
+                pass
+    
+    # One sum serves both the total and the average (0 with no amounts)
+    total = sum(amounts)
+    return {
+        'prices': prices,
+        'count': len(prices),
+        'total': total,
+        'average': total/len(amounts) if amounts else 0,
+        'min': min(amounts) if amounts else 0,
+        'max': max(amounts) if amounts else 0
+    }
+
+def extract_chunk(texts):
+    """Price strings in a Series of texts, in order"""
+    return [price for text in texts for price in find_prices(text)]